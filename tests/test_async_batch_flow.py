@@ -8,17 +8,14 @@ from pocketflow import AsyncNode, AsyncBatchFlow
 
 class AsyncDataProcessNode(AsyncNode):
     async def prep_async(self, shared_storage):
-        key = self.params.get('key')
+        key = self.params['key']
         data = shared_storage['input_data'][key]
-        if 'results' not in shared_storage:
-            shared_storage['results'] = {}
         shared_storage['results'][key] = data
         return data
 
     async def post_async(self, shared_storage, prep_result, proc_result):
-        await asyncio.sleep(0.01)  # Simulate async work
-        key = self.params.get('key')
-        shared_storage['results'][key] = prep_result * 2  # Double the value
+        await asyncio.sleep(0)  # Simulate async work
+        shared_storage['results'][self.params['key']] = prep_result * 2  # Double the value
         return "processed"
 
 class AsyncErrorNode(AsyncNode):
@@ -28,15 +25,16 @@ class AsyncErrorNode(AsyncNode):
             raise ValueError(f"Async error processing key: {key}")
         return "processed"
 
-class TestAsyncBatchFlow(unittest.TestCase):
+class TestAsyncBatchFlow(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.process_node = AsyncDataProcessNode()
 
-    def test_basic_async_batch_processing(self):
+    async def test_basic_async_batch_processing(self):
         """Test basic async batch processing with multiple keys"""
         class SimpleTestAsyncBatchFlow(AsyncBatchFlow):
             async def prep_async(self, shared_storage):
-                return [{'key': k} for k in shared_storage['input_data'].keys()]
+                shared_storage.setdefault('results', {})
+                return [{'key': k} for k in shared_storage['input_data']]
 
         shared_storage = {
             'input_data': {
@@ -47,7 +45,7 @@ class TestAsyncBatchFlow(unittest.TestCase):
         }
 
         flow = SimpleTestAsyncBatchFlow(start=self.process_node)
-        asyncio.run(flow.run_async(shared_storage))
+        await flow.run_async(shared_storage)
 
         expected_results = {
             'a': 2,  # 1 * 2
@@ -56,26 +54,27 @@ class TestAsyncBatchFlow(unittest.TestCase):
         }
         self.assertEqual(shared_storage['results'], expected_results)
 
-    def test_empty_async_batch(self):
+    async def test_empty_async_batch(self):
         """Test async batch processing with empty input"""
         class EmptyTestAsyncBatchFlow(AsyncBatchFlow):
             async def prep_async(self, shared_storage):
-                return [{'key': k} for k in shared_storage['input_data'].keys()]
+                shared_storage.setdefault('results', {})
+                return [{'key': k} for k in shared_storage['input_data']]
 
         shared_storage = {
             'input_data': {}
         }
 
         flow = EmptyTestAsyncBatchFlow(start=self.process_node)
-        asyncio.run(flow.run_async(shared_storage))
+        await flow.run_async(shared_storage)
 
         self.assertEqual(shared_storage.get('results', {}), {})
 
-    def test_async_error_handling(self):
+    async def test_async_error_handling(self):
         """Test error handling during async batch processing"""
         class ErrorTestAsyncBatchFlow(AsyncBatchFlow):
             async def prep_async(self, shared_storage):
-                return [{'key': k} for k in shared_storage['input_data'].keys()]
+                return [{'key': k} for k in shared_storage['input_data']]
 
         shared_storage = {
             'input_data': {
@@ -88,31 +87,29 @@ class TestAsyncBatchFlow(unittest.TestCase):
         flow = ErrorTestAsyncBatchFlow(start=AsyncErrorNode())
         
         with self.assertRaises(ValueError):
-            asyncio.run(flow.run_async(shared_storage))
+            await flow.run_async(shared_storage)
 
-    def test_nested_async_flow(self):
+    async def test_nested_async_flow(self):
         """Test async batch processing with nested flows"""
         class AsyncInnerNode(AsyncNode):
             async def post_async(self, shared_storage, prep_result, proc_result):
-                key = self.params.get('key')
-                if 'intermediate_results' not in shared_storage:
-                    shared_storage['intermediate_results'] = {}
+                key = self.params['key']
                 shared_storage['intermediate_results'][key] = shared_storage['input_data'][key] + 1
-                await asyncio.sleep(0.01)
+                await asyncio.sleep(0)
                 return "next"
 
         class AsyncOuterNode(AsyncNode):
             async def post_async(self, shared_storage, prep_result, proc_result):
-                key = self.params.get('key')
-                if 'results' not in shared_storage:
-                    shared_storage['results'] = {}
+                key = self.params['key']
                 shared_storage['results'][key] = shared_storage['intermediate_results'][key] * 2
-                await asyncio.sleep(0.01)
+                await asyncio.sleep(0)
                 return "done"
 
         class NestedAsyncBatchFlow(AsyncBatchFlow):
             async def prep_async(self, shared_storage):
-                return [{'key': k} for k in shared_storage['input_data'].keys()]
+                shared_storage.setdefault('intermediate_results', {})
+                shared_storage.setdefault('results', {})
+                return [{'key': k} for k in shared_storage['input_data']]
 
         # Create inner flow
         inner_node = AsyncInnerNode()
@@ -127,7 +124,7 @@ class TestAsyncBatchFlow(unittest.TestCase):
         }
 
         flow = NestedAsyncBatchFlow(start=inner_node)
-        asyncio.run(flow.run_async(shared_storage))
+        await flow.run_async(shared_storage)
 
         expected_results = {
             'x': 4,  # (1 + 1) * 2
@@ -135,24 +132,24 @@ class TestAsyncBatchFlow(unittest.TestCase):
         }
         self.assertEqual(shared_storage['results'], expected_results)
 
-    def test_custom_async_parameters(self):
+    async def test_custom_async_parameters(self):
         """Test async batch processing with additional custom parameters"""
         class CustomParamAsyncNode(AsyncNode):
             async def post_async(self, shared_storage, prep_result, proc_result):
-                key = self.params.get('key')
-                multiplier = self.params.get('multiplier', 1)
-                await asyncio.sleep(0.01)
-                if 'results' not in shared_storage:
-                    shared_storage['results'] = {}
+                params = self.params
+                key = params['key']
+                multiplier = params.get('multiplier', 1)
+                await asyncio.sleep(0)
                 shared_storage['results'][key] = shared_storage['input_data'][key] * multiplier
                 return "done"
 
         class CustomParamAsyncBatchFlow(AsyncBatchFlow):
             async def prep_async(self, shared_storage):
+                shared_storage.setdefault('results', {})
                 return [{
                     'key': k,
                     'multiplier': i + 1
-                } for i, k in enumerate(shared_storage['input_data'].keys())]
+                } for i, k in enumerate(shared_storage['input_data'])]
 
         shared_storage = {
             'input_data': {
@@ -163,7 +160,7 @@ class TestAsyncBatchFlow(unittest.TestCase):
         }
 
         flow = CustomParamAsyncBatchFlow(start=CustomParamAsyncNode())
-        asyncio.run(flow.run_async(shared_storage))
+        await flow.run_async(shared_storage)
 
         expected_results = {
             'a': 1 * 1,  # first item, multiplier = 1
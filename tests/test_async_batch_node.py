@@ -14,15 +14,12 @@ class AsyncArrayChunkNode(AsyncBatchNode):
     async def prep_async(self, shared_storage):
         # Get array from shared storage and split into chunks
         array = shared_storage.get('input_array', [])
-        chunks = []
-        for start in range(0, len(array), self.chunk_size):
-            end = min(start + self.chunk_size, len(array))
-            chunks.append(array[start:end])
-        return chunks
+        n = self.chunk_size
+        return [array[start:start + n] for start in range(0, len(array), n)]
     
     async def exec_async(self, chunk):
         # Simulate async processing of each chunk
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return sum(chunk)
         
     async def post_async(self, shared_storage, prep_result, proc_result):
@@ -34,13 +31,13 @@ class AsyncSumReduceNode(AsyncNode):
     async def prep_async(self, shared_storage):
         # Get chunk results from shared storage
         chunk_results = shared_storage.get('chunk_results', [])
-        await asyncio.sleep(0.01)  # Simulate async processing
+        await asyncio.sleep(0)  # Simulate async processing
         total = sum(chunk_results)
         shared_storage['total'] = total
         return "reduced"
 
-class TestAsyncBatchNode(unittest.TestCase):
-    def test_array_chunking(self):
+class TestAsyncBatchNode(unittest.IsolatedAsyncioTestCase):
+    async def test_array_chunking(self):
         """
         Test that the array is correctly split into chunks and processed asynchronously
         """
@@ -49,12 +46,25 @@ class TestAsyncBatchNode(unittest.TestCase):
         }
         
         chunk_node = AsyncArrayChunkNode(chunk_size=10)
-        asyncio.run(chunk_node.run_async(shared_storage))
+        await chunk_node.run_async(shared_storage)
         
         results = shared_storage['chunk_results']
         self.assertEqual(results, [45, 145, 110])  # Sum of chunks [0-9], [10-19], [20-24]
+
+    async def test_none_batch(self):
+        """
+        Test that a None batch from prep_async is treated as empty
+        """
+        class NoneBatchNode(AsyncArrayChunkNode):
+            async def prep_async(self, shared_storage):
+                return None
+
+        shared_storage = {}
+        await NoneBatchNode().run_async(shared_storage)
+
+        self.assertEqual(shared_storage['chunk_results'], [])
         
-    # def test_async_map_reduce_sum(self):
+    # async def test_async_map_reduce_sum(self):
     #     """
     #     Test a complete async map-reduce pipeline that sums a large array:
     #     1. Map: Split array into chunks and sum each chunk asynchronously
@@ -76,11 +86,11 @@ class TestAsyncBatchNode(unittest.TestCase):
         
     #     # Create and run pipeline
     #     pipeline = AsyncFlow(start=chunk_node)
-    #     asyncio.run(pipeline.run_async(shared_storage))
+    #     await pipeline.run_async(shared_storage)
         
     #     self.assertEqual(shared_storage['total'], expected_sum)
         
-    # def test_uneven_chunks(self):
+    # async def test_uneven_chunks(self):
     #     """
     #     Test that the async map-reduce works correctly with array lengths
     #     that don't divide evenly by chunk_size
@@ -97,11 +107,11 @@ class TestAsyncBatchNode(unittest.TestCase):
         
     #     chunk_node - "processed" >> reduce_node
     #     pipeline = AsyncFlow(start=chunk_node)
-    #     asyncio.run(pipeline.run_async(shared_storage))
+    #     await pipeline.run_async(shared_storage)
         
     #     self.assertEqual(shared_storage['total'], expected_sum)
 
-    # def test_custom_chunk_size(self):
+    # async def test_custom_chunk_size(self):
     #     """
     #     Test that the async map-reduce works with different chunk sizes
     #     """
@@ -118,11 +128,11 @@ class TestAsyncBatchNode(unittest.TestCase):
         
     #     chunk_node - "processed" >> reduce_node
     #     pipeline = AsyncFlow(start=chunk_node)
-    #     asyncio.run(pipeline.run_async(shared_storage))
+    #     await pipeline.run_async(shared_storage)
         
     #     self.assertEqual(shared_storage['total'], expected_sum)
         
-    # def test_single_element_chunks(self):
+    # async def test_single_element_chunks(self):
     #     """
     #     Test extreme case where chunk_size=1
     #     """
@@ -138,11 +148,11 @@ class TestAsyncBatchNode(unittest.TestCase):
         
     #     chunk_node - "processed" >> reduce_node
     #     pipeline = AsyncFlow(start=chunk_node)
-    #     asyncio.run(pipeline.run_async(shared_storage))
+    #     await pipeline.run_async(shared_storage)
         
     #     self.assertEqual(shared_storage['total'], expected_sum)
 
-    # def test_empty_array(self):
+    # async def test_empty_array(self):
     #     """
     #     Test edge case of empty input array
     #     """
@@ -155,11 +165,11 @@ class TestAsyncBatchNode(unittest.TestCase):
         
     #     chunk_node - "processed" >> reduce_node
     #     pipeline = AsyncFlow(start=chunk_node)
-    #     asyncio.run(pipeline.run_async(shared_storage))
+    #     await pipeline.run_async(shared_storage)
         
     #     self.assertEqual(shared_storage['total'], 0)
 
-    # def test_error_handling(self):
+    # async def test_error_handling(self):
     #     """
     #     Test error handling in async batch processing
     #     """
@@ -175,7 +185,7 @@ class TestAsyncBatchNode(unittest.TestCase):
         
     #     error_node = ErrorAsyncBatchNode()
     #     with self.assertRaises(ValueError):
-    #         asyncio.run(error_node.run_async(shared_storage))
+    #         await error_node.run_async(shared_storage)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
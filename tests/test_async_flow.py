@@ -25,7 +25,7 @@ class AsyncNumberNode(AsyncNode):
 
     async def post_async(self, shared_storage, prep_result, proc_result):
         # Possibly do asynchronous tasks here
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         # Return a condition for the flow
         return "number_set"
 
@@ -39,46 +39,40 @@ class AsyncIncrementNode(AsyncNode):
         return "incremented"
 
     async def post_async(self, shared_storage, prep_result, proc_result):
-        await asyncio.sleep(0.01)  # simulate async I/O
+        await asyncio.sleep(0)  # simulate async I/O
         return "done"
 
 
-class TestAsyncNode(unittest.TestCase):
+class TestAsyncNode(unittest.IsolatedAsyncioTestCase):
     """
     Test the AsyncNode (and descendants) in isolation (not in a flow).
     """
-    def test_async_number_node_direct_call(self):
+    async def test_async_number_node_direct_call(self):
         """
         Even though AsyncNumberNode is designed for an async flow,
         we can still test it directly by calling run_async().
         """
-        async def run_node():
-            node = AsyncNumberNode(42)
-            shared_storage = {}
-            condition = await node.run_async(shared_storage)
-            return shared_storage, condition
+        node = AsyncNumberNode(42)
+        shared_storage = {}
+        condition = await node.run_async(shared_storage)
 
-        shared_storage, condition = asyncio.run(run_node())
         self.assertEqual(shared_storage['current'], 42)
         self.assertEqual(condition, "number_set")
 
-    def test_async_increment_node_direct_call(self):
-        async def run_node():
-            node = AsyncIncrementNode()
-            shared_storage = {'current': 10}
-            condition = await node.run_async(shared_storage)
-            return shared_storage, condition
+    async def test_async_increment_node_direct_call(self):
+        node = AsyncIncrementNode()
+        shared_storage = {'current': 10}
+        condition = await node.run_async(shared_storage)
 
-        shared_storage, condition = asyncio.run(run_node())
         self.assertEqual(shared_storage['current'], 11)
         self.assertEqual(condition, "done")
 
 
-class TestAsyncFlow(unittest.TestCase):
+class TestAsyncFlow(unittest.IsolatedAsyncioTestCase):
     """
     Test how AsyncFlow orchestrates multiple async nodes.
     """
-    def test_simple_async_flow(self):
+    async def test_simple_async_flow(self):
         """
         Flow:
           1) AsyncNumberNode(5) -> sets 'current' to 5
@@ -95,13 +89,12 @@ class TestAsyncFlow(unittest.TestCase):
         # Create an AsyncFlow with start
         flow = AsyncFlow(start)
 
-        # We'll run the flow synchronously (which under the hood is asyncio.run())
         shared_storage = {}
-        asyncio.run(flow.run_async(shared_storage))
+        await flow.run_async(shared_storage)
 
         self.assertEqual(shared_storage['current'], 6)
 
-    def test_async_flow_branching(self):
+    async def test_async_flow_branching(self):
         """
         Demonstrate a branching scenario where we return different
         conditions. For example, you could have an async node that
@@ -117,7 +110,7 @@ class TestAsyncFlow(unittest.TestCase):
                 return None
 
             async def post_async(self, shared_storage, prep_result, proc_result):
-                await asyncio.sleep(0.01)
+                await asyncio.sleep(0)
                 if shared_storage["value"] >= 0:
                     return "positive_branch"
                 else:
@@ -144,7 +137,7 @@ class TestAsyncFlow(unittest.TestCase):
         start - "negative_branch" >> negative_node
 
         flow = AsyncFlow(start)
-        asyncio.run(flow.run_async(shared_storage))
+        await flow.run_async(shared_storage)
 
         self.assertEqual(shared_storage["path"], "positive", 
                          "Should have taken the positive branch")
@@ -1,6 +1,8 @@
 import unittest
 import asyncio
+import itertools
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,44 +22,44 @@ class AsyncParallelNumberProcessor(AsyncParallelBatchNode):
         return number * 2
         
     async def post_async(self, shared_storage, prep_result, exec_result):
-        if 'processed_numbers' not in shared_storage:
-            shared_storage['processed_numbers'] = {}
         shared_storage['processed_numbers'][self.params['batch_id']] = exec_result
         return "processed"
 
 class AsyncAggregatorNode(AsyncNode):
     async def prep_async(self, shared_storage):
-        # Combine all batch results in order
-        all_results = []
-        processed = shared_storage.get('processed_numbers', {})
-        for i in range(len(processed)):
-            all_results.extend(processed[i])
-        return all_results
+        # Combine all finished batch results in order. The aggregator runs
+        # once per batch, so every run but the last sees slots whose batch
+        # hasn't finished yet (still None); those are skipped
+        processed = shared_storage['processed_numbers']
+        return list(itertools.chain.from_iterable(b for b in processed if b is not None))
     
     async def exec_async(self, prep_result):
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return sum(prep_result)
     
     async def post_async(self, shared_storage, prep_result, exec_result):
         shared_storage['total'] = exec_result
         return "aggregated"
 
-class TestAsyncParallelBatchFlow(unittest.TestCase):
-    def setUp(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-    
-    def tearDown(self):
-        self.loop.close()
-
-    def test_parallel_batch_flow(self):
+class IndexedBatchFlow(AsyncParallelBatchFlow):
+    async def prep_async(self, shared_storage):
+        shared_storage['processed_numbers'] = [None] * len(shared_storage['batches'])
+        return [{'batch_id': i} for i in range(len(shared_storage['batches']))]
+
+class TestAsyncParallelBatchFlow(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The graph is never mutated by a run (flows execute copies of
+        # their nodes), so it is wired once and shared by the tests
+        cls.processor = AsyncParallelNumberProcessor(delay=0)
+        cls.aggregator = AsyncAggregatorNode()
+        cls.processor - "processed" >> cls.aggregator
+        cls.flow = IndexedBatchFlow(start=cls.processor)
+
+    async def test_parallel_batch_flow(self):
         """
         Test basic parallel batch processing flow with batch IDs
         """
-        class TestParallelBatchFlow(AsyncParallelBatchFlow):
-            async def prep_async(self, shared_storage):
-                return [{'batch_id': i} for i in range(len(shared_storage['batches']))]
-
         shared_storage = {
             'batches': [
                 [1, 2, 3],  # batch_id: 0
@@ -70,18 +72,18 @@ class TestAsyncParallelBatchFlow(unittest.TestCase):
         aggregator = AsyncAggregatorNode()
         
         processor - "processed" >> aggregator
-        flow = TestParallelBatchFlow(start=processor)
+        flow = IndexedBatchFlow(start=processor)
         
-        start_time = self.loop.time()
-        self.loop.run_until_complete(flow.run_async(shared_storage))
-        execution_time = self.loop.time() - start_time
+        start_ns = time.perf_counter_ns()
+        await flow.run_async(shared_storage)
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
         # Verify each batch was processed correctly
-        expected_batch_results = {
-            0: [2, 4, 6],    # [1,2,3] * 2
-            1: [8, 10, 12],  # [4,5,6] * 2
-            2: [14, 16, 18]  # [7,8,9] * 2
-        }
+        expected_batch_results = [
+            [2, 4, 6],    # [1,2,3] * 2
+            [8, 10, 12],  # [4,5,6] * 2
+            [14, 16, 18]  # [7,8,9] * 2
+        ]
         self.assertEqual(shared_storage['processed_numbers'], expected_batch_results)
         
         # Verify total
@@ -89,9 +91,9 @@ class TestAsyncParallelBatchFlow(unittest.TestCase):
         self.assertEqual(shared_storage['total'], expected_total)
         
         # Verify parallel execution
-        self.assertLess(execution_time, 0.2)
+        self.assertLess(elapsed_ns, 200_000_000)
 
-    def test_error_handling(self):
+    async def test_error_handling(self):
         """
         Test error handling in parallel batch flow
         """
@@ -101,10 +103,6 @@ class TestAsyncParallelBatchFlow(unittest.TestCase):
                     raise ValueError(f"Error processing item {item}")
                 return item
 
-        class ErrorBatchFlow(AsyncParallelBatchFlow):
-            async def prep_async(self, shared_storage):
-                return [{'batch_id': i} for i in range(len(shared_storage['batches']))]
-
         shared_storage = {
             'batches': [
                 [1, 2, 3],  # Contains error-triggering value
@@ -113,19 +111,15 @@ class TestAsyncParallelBatchFlow(unittest.TestCase):
         }
 
         processor = ErrorProcessor()
-        flow = ErrorBatchFlow(start=processor)
+        flow = IndexedBatchFlow(start=processor)
         
         with self.assertRaises(ValueError):
-            self.loop.run_until_complete(flow.run_async(shared_storage))
+            await flow.run_async(shared_storage)
 
-    def test_multiple_batch_sizes(self):
+    async def test_multiple_batch_sizes(self):
         """
         Test parallel batch flow with varying batch sizes
         """
-        class VaryingBatchFlow(AsyncParallelBatchFlow):
-            async def prep_async(self, shared_storage):
-                return [{'batch_id': i} for i in range(len(shared_storage['batches']))]
-
         shared_storage = {
             'batches': [
                 [1],           # batch_id: 0
@@ -135,21 +129,15 @@ class TestAsyncParallelBatchFlow(unittest.TestCase):
             ]
         }
 
-        processor = AsyncParallelNumberProcessor(delay=0.05)
-        aggregator = AsyncAggregatorNode()
-        
-        processor - "processed" >> aggregator
-        flow = VaryingBatchFlow(start=processor)
-        
-        self.loop.run_until_complete(flow.run_async(shared_storage))
+        await self.flow.run_async(shared_storage)
         
         # Verify each batch was processed correctly
-        expected_batch_results = {
-            0: [2],                 # [1] * 2
-            1: [4, 6, 8],          # [2,3,4] * 2
-            2: [10, 12],           # [5,6] * 2
-            3: [14, 16, 18, 20]    # [7,8,9,10] * 2
-        }
+        expected_batch_results = [
+            [2],                 # [1] * 2
+            [4, 6, 8],          # [2,3,4] * 2
+            [10, 12],           # [5,6] * 2
+            [14, 16, 18, 20]    # [7,8,9,10] * 2
+        ]
         self.assertEqual(shared_storage['processed_numbers'], expected_batch_results)
         
         # Verify total
@@ -18,10 +18,6 @@ class AsyncParallelNumberProcessor extends AsyncParallelBatchNode {
   }
 
   async postAsync(sharedStorage: Record<string, any>, prepResult: any, execResult: any) {
-    if (!sharedStorage['processed_numbers']) {
-      sharedStorage['processed_numbers'] = {}
-    }
-
     sharedStorage['processed_numbers'][this.params['batch_id']] = execResult
     return 'processed'
   }
@@ -29,23 +25,11 @@ class AsyncParallelNumberProcessor extends AsyncParallelBatchNode {
 
 class AsyncAggregatorNode extends AsyncNode {
   async prepAsync(sharedStorage: Record<string, any>) {
-    const allResults: number[] = []
-    const processed = sharedStorage['processed_numbers'] || {}
-
-    // Ensure we're iterating over arrays properly
-    Object.keys(processed).forEach((key) => {
-      const value = processed[key]
-      if (Array.isArray(value)) {
-        // Ensure we're only adding numbers
-        value.forEach((item) => {
-          if (typeof item === 'number') {
-            allResults.push(item)
-          }
-        })
-      }
-    })
-
-    return allResults
+    // Combine all finished batch results in order. The aggregator runs
+    // once per batch, so every run but the last sees slots whose batch
+    // hasn't finished yet (still null); those are skipped
+    const processed: (number[] | null)[] = sharedStorage['processed_numbers']
+    return processed.filter((batch): batch is number[] => batch !== null).flat()
   }
 
   async execAsync(prepResult: number[]) {
@@ -63,6 +47,7 @@ describe('AsyncParallelBatchFlow Tests', () => {
   it('should handle parallel batch flow', async () => {
     class TestParallelBatchFlow extends AsyncParallelBatchFlow {
       async prepAsync(sharedStorage: Record<string, any>) {
+        sharedStorage['processed_numbers'] = new Array(sharedStorage['batches'].length).fill(null)
         return Array.from({ length: sharedStorage['batches'].length }, (_, i) => ({ batch_id: i }))
       }
     }
@@ -85,11 +70,11 @@ describe('AsyncParallelBatchFlow Tests', () => {
     const executionTime = Date.now() - startTime
 
     // Verify each batch was processed correctly
-    assert.deepStrictEqual(sharedStorage['processed_numbers'], {
-      0: [2, 4, 6], // [1,2,3] * 2
-      1: [8, 10, 12], // [4,5,6] * 2
-      2: [14, 16, 18], // [7,8,9] * 2
-    })
+    assert.deepStrictEqual(sharedStorage['processed_numbers'], [
+      [2, 4, 6], // [1,2,3] * 2
+      [8, 10, 12], // [4,5,6] * 2
+      [14, 16, 18], // [7,8,9] * 2
+    ])
 
     // Verify total
     const expectedTotal = sharedStorage['batches']
@@ -144,6 +129,7 @@ describe('AsyncParallelBatchFlow Tests', () => {
   it('should handle multiple batch sizes', async () => {
     class VaryingBatchFlow extends AsyncParallelBatchFlow {
       async prepAsync(sharedStorage: Record<string, any>) {
+        sharedStorage['processed_numbers'] = new Array(sharedStorage['batches'].length).fill(null)
         return Array.from({ length: sharedStorage['batches'].length }, (_, i) => ({ batch_id: i }))
       }
     }
@@ -165,12 +151,12 @@ describe('AsyncParallelBatchFlow Tests', () => {
     await flow.runAsync(sharedStorage)
 
     // Verify each batch was processed correctly
-    assert.deepStrictEqual(sharedStorage['processed_numbers'], {
-      0: [2], // [1] * 2
-      1: [4, 6, 8], // [2,3,4] * 2
-      2: [10, 12], // [5,6] * 2
-      3: [14, 16, 18, 20], // [7,8,9,10] * 2
-    })
+    assert.deepStrictEqual(sharedStorage['processed_numbers'], [
+      [2], // [1] * 2
+      [4, 6, 8], // [2,3,4] * 2
+      [10, 12], // [5,6] * 2
+      [14, 16, 18, 20], // [7,8,9,10] * 2
+    ])
 
     // Verify total
     const expectedTotal = sharedStorage['batches']
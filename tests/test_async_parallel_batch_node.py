@@ -1,8 +1,14 @@
 import unittest
 import asyncio
 import sys
+import time
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from pocketflow import AsyncParallelBatchNode, AsyncParallelBatchFlow
 
@@ -23,16 +29,20 @@ class AsyncParallelNumberProcessor(AsyncParallelBatchNode):
         shared_storage['processed_numbers'] = exec_result
         return "processed"
 
-class TestAsyncParallelBatchNode(unittest.TestCase):
-    def setUp(self):
-        # Reset the event loop for each test
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-    
-    def tearDown(self):
-        self.loop.close()
-    
-    def test_parallel_processing(self):
+class TestAsyncParallelBatchNode(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Use the libuv-backed event loop when uvloop is installed
+        if uvloop is not None:
+            cls.saved_policy = asyncio.get_event_loop_policy()
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    @classmethod
+    def tearDownClass(cls):
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(cls.saved_policy)
+
+    async def test_parallel_processing(self):
         """
         Test that numbers are processed in parallel by measuring execution time
         """
@@ -43,9 +53,9 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
         processor = AsyncParallelNumberProcessor(delay=0.1)
         
         # Run the processor
-        start_time = asyncio.get_event_loop().time()
-        self.loop.run_until_complete(processor.run_async(shared_storage))
-        end_time = asyncio.get_event_loop().time()
+        start_ns = time.perf_counter_ns()
+        await processor.run_async(shared_storage)
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         # Check results
         expected = [0, 2, 4, 6, 8]  # Each number doubled
@@ -53,10 +63,9 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
         
         # Since processing is parallel, total time should be approximately
         # equal to the delay of a single operation, not delay * number_of_items
-        execution_time = end_time - start_time
-        self.assertLess(execution_time, 0.2)  # Should be around 0.1s plus minimal overhead
+        self.assertLess(elapsed_ns, 200_000_000)  # Should be around 0.1s plus minimal overhead
     
-    def test_empty_input(self):
+    async def test_empty_input(self):
         """
         Test processing of empty input
         """
@@ -64,12 +73,25 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
             'input_numbers': []
         }
         
-        processor = AsyncParallelNumberProcessor()
-        self.loop.run_until_complete(processor.run_async(shared_storage))
+        processor = AsyncParallelNumberProcessor(delay=0)
+        await processor.run_async(shared_storage)
+        
+        self.assertEqual(shared_storage['processed_numbers'], [])
+    
+    async def test_none_input(self):
+        """
+        Test that a None batch from prep_async is treated as empty
+        """
+        shared_storage = {
+            'input_numbers': None
+        }
+        
+        processor = AsyncParallelNumberProcessor(delay=0)
+        await processor.run_async(shared_storage)
         
         self.assertEqual(shared_storage['processed_numbers'], [])
     
-    def test_single_item(self):
+    async def test_single_item(self):
         """
         Test processing of a single item
         """
@@ -77,12 +99,12 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
             'input_numbers': [42]
         }
         
-        processor = AsyncParallelNumberProcessor()
-        self.loop.run_until_complete(processor.run_async(shared_storage))
+        processor = AsyncParallelNumberProcessor(delay=0)
+        await processor.run_async(shared_storage)
         
         self.assertEqual(shared_storage['processed_numbers'], [84])
     
-    def test_large_batch(self):
+    async def test_large_batch(self):
         """
         Test processing of a large batch of numbers
         """
@@ -91,13 +113,13 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
             'input_numbers': list(range(input_size))
         }
         
-        processor = AsyncParallelNumberProcessor(delay=0.01)
-        self.loop.run_until_complete(processor.run_async(shared_storage))
+        processor = AsyncParallelNumberProcessor(delay=0)
+        await processor.run_async(shared_storage)
         
         expected = [x * 2 for x in range(input_size)]
         self.assertEqual(shared_storage['processed_numbers'], expected)
     
-    def test_error_handling(self):
+    async def test_error_handling(self):
         """
         Test error handling during parallel processing
         """
@@ -113,9 +135,9 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
         
         processor = ErrorProcessor()
         with self.assertRaises(ValueError):
-            self.loop.run_until_complete(processor.run_async(shared_storage))
+            await processor.run_async(shared_storage)
     
-    def test_concurrent_execution(self):
+    async def test_concurrent_execution(self):
         """
         Test that tasks are actually running concurrently by tracking execution order
         """
@@ -133,7 +155,7 @@ class TestAsyncParallelBatchNode(unittest.TestCase):
         }
         
         processor = OrderTrackingProcessor()
-        self.loop.run_until_complete(processor.run_async(shared_storage))
+        await processor.run_async(shared_storage)
         
         # Odd numbers should finish before even numbers due to shorter delay
         self.assertLess(execution_order.index(1), execution_order.index(0))
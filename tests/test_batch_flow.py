@@ -7,10 +7,8 @@ from pocketflow import Node, BatchFlow, Flow
 
 class DataProcessNode(Node):
     def prep(self, shared_storage):
-        key = self.params.get('key')
+        key = self.params['key']
         data = shared_storage['input_data'][key]
-        if 'results' not in shared_storage:
-            shared_storage['results'] = {}
         shared_storage['results'][key] = data * 2
 
 class ErrorProcessNode(Node):
@@ -18,8 +16,6 @@ class ErrorProcessNode(Node):
         key = self.params.get('key')
         if key == 'error_key':
             raise ValueError(f"Error processing key: {key}")
-        if 'results' not in shared_storage:
-            shared_storage['results'] = {}
         shared_storage['results'][key] = True
 
 class TestBatchFlow(unittest.TestCase):
@@ -30,6 +26,7 @@ class TestBatchFlow(unittest.TestCase):
         """Test basic batch processing with multiple keys"""
         class SimpleTestBatchFlow(BatchFlow):
             def prep(self, shared_storage):
+                shared_storage.setdefault('results', {})
                 return [{'key': k} for k in shared_storage['input_data'].keys()]
 
         shared_storage = {
@@ -54,6 +51,7 @@ class TestBatchFlow(unittest.TestCase):
         """Test batch processing with empty input dictionary"""
         class EmptyTestBatchFlow(BatchFlow):
             def prep(self, shared_storage):
+                shared_storage.setdefault('results', {})
                 return [{'key': k} for k in shared_storage['input_data'].keys()]
 
         shared_storage = {
@@ -69,6 +67,7 @@ class TestBatchFlow(unittest.TestCase):
         """Test batch processing with single item"""
         class SingleItemBatchFlow(BatchFlow):
             def prep(self, shared_storage):
+                shared_storage.setdefault('results', {})
                 return [{'key': k} for k in shared_storage['input_data'].keys()]
 
         shared_storage = {
@@ -89,6 +88,7 @@ class TestBatchFlow(unittest.TestCase):
         """Test error handling during batch processing"""
         class ErrorTestBatchFlow(BatchFlow):
             def prep(self, shared_storage):
+                shared_storage.setdefault('results', {})
                 return [{'key': k} for k in shared_storage['input_data'].keys()]
 
         shared_storage = {
@@ -108,20 +108,18 @@ class TestBatchFlow(unittest.TestCase):
         """Test batch processing with nested flows"""
         class InnerNode(Node):
             def exec(self, prep_result):
-                key = self.params.get('key')
-                if 'intermediate_results' not in shared_storage:
-                    shared_storage['intermediate_results'] = {}
+                key = self.params['key']
                 shared_storage['intermediate_results'][key] = shared_storage['input_data'][key] + 1
 
         class OuterNode(Node):
             def exec(self, prep_result):
-                key = self.params.get('key')
-                if 'results' not in shared_storage:
-                    shared_storage['results'] = {}
+                key = self.params['key']
                 shared_storage['results'][key] = shared_storage['intermediate_results'][key] * 2
 
         class NestedBatchFlow(BatchFlow):
             def prep(self, shared_storage):
+                shared_storage.setdefault('intermediate_results', {})
+                shared_storage.setdefault('results', {})
                 return [{'key': k} for k in shared_storage['input_data'].keys()]
 
         # Create inner flow
@@ -149,14 +147,14 @@ class TestBatchFlow(unittest.TestCase):
         """Test batch processing with additional custom parameters"""
         class CustomParamNode(Node):
             def exec(self, prep_result):
-                key = self.params.get('key')
-                multiplier = self.params.get('multiplier', 1)
-                if 'results' not in shared_storage:
-                    shared_storage['results'] = {}
+                params = self.params
+                key = params['key']
+                multiplier = params.get('multiplier', 1)
                 shared_storage['results'][key] = shared_storage['input_data'][key] * multiplier
 
         class CustomParamBatchFlow(BatchFlow):
             def prep(self, shared_storage):
+                shared_storage.setdefault('results', {})
                 return [{
                     'key': k,
                     'multiplier': i + 1
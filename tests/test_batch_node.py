@@ -13,16 +13,12 @@ class ArrayChunkNode(BatchNode):
     def prep(self, shared_storage):
         # Get array from shared storage and split into chunks
         array = shared_storage.get('input_array', [])
-        chunks = []
-        for start in range(0, len(array), self.chunk_size):
-            end = min(start + self.chunk_size, len(array))
-            chunks.append(array[start: end])
-        return chunks
+        n = self.chunk_size
+        return [array[start:start + n] for start in range(0, len(array), n)]
     
     def exec(self, chunk):
         # Process the chunk and return its sum
-        chunk_sum = sum(chunk)
-        return chunk_sum
+        return sum(chunk)
         
     def post(self, shared_storage, prep_result, proc_result):
         # Store chunk results in shared storage
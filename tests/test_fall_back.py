@@ -13,8 +13,7 @@ class FallbackNode(Node):
         self.attempt_count = 0
     
     def prep(self, shared_storage):
-        if 'results' not in shared_storage:
-            shared_storage['results'] = []
+        shared_storage.setdefault('results', [])
         return None
     
     def exec(self, prep_result):
@@ -39,8 +38,7 @@ class AsyncFallbackNode(AsyncNode):
         self.attempt_count = 0
     
     async def prep_async(self, shared_storage):
-        if 'results' not in shared_storage:
-            shared_storage['results'] = []
+        shared_storage.setdefault('results', [])
         return None
     
     async def exec_async(self, prep_result):
@@ -50,7 +48,7 @@ class AsyncFallbackNode(AsyncNode):
         return "success"
     
     async def exec_fallback_async(self, prep_result, exc):
-        await asyncio.sleep(0.01)  # Simulate async work
+        await asyncio.sleep(0)  # Simulate async work
         return "async_fallback"
     
     async def post_async(self, shared_storage, prep_result, exec_result):
@@ -109,8 +107,7 @@ class TestExecFallback(unittest.TestCase):
         """Test that default fallback behavior raises the exception"""
         class NoFallbackNode(Node):
             def prep(self, shared_storage):
-                if 'results' not in shared_storage:
-                    shared_storage['results'] = []
+                shared_storage.setdefault('results', [])
                 return None
             
             def exec(self, prep_result):
@@ -135,42 +132,28 @@ class TestExecFallback(unittest.TestCase):
         self.assertEqual(shared_storage['results'][0]['attempts'], 3)
         self.assertEqual(shared_storage['results'][0]['result'], "fallback")
 
-class TestAsyncExecFallback(unittest.TestCase):
-    def setUp(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-    
-    def tearDown(self):
-        self.loop.close()
-
-    def test_async_successful_execution(self):
+class TestAsyncExecFallback(unittest.IsolatedAsyncioTestCase):
+    async def test_async_successful_execution(self):
         """Test that async exec_fallback is not called when execution succeeds"""
-        async def run_test():
-            shared_storage = {}
-            node = AsyncFallbackNode(should_fail=False)
-            await node.run_async(shared_storage)
-            return shared_storage
+        shared_storage = {}
+        node = AsyncFallbackNode(should_fail=False)
+        await node.run_async(shared_storage)
         
-        shared_storage = self.loop.run_until_complete(run_test())
         self.assertEqual(len(shared_storage['results']), 1)
         self.assertEqual(shared_storage['results'][0]['attempts'], 1)
         self.assertEqual(shared_storage['results'][0]['result'], "success")
 
-    def test_async_fallback_after_failure(self):
+    async def test_async_fallback_after_failure(self):
         """Test that async exec_fallback is called after all retries are exhausted"""
-        async def run_test():
-            shared_storage = {}
-            node = AsyncFallbackNode(should_fail=True, max_retries=2)
-            await node.run_async(shared_storage)
-            return shared_storage
-        
-        shared_storage = self.loop.run_until_complete(run_test())
+        shared_storage = {}
+        node = AsyncFallbackNode(should_fail=True, max_retries=2)
+        await node.run_async(shared_storage)
         
         self.assertEqual(len(shared_storage['results']), 1)
         self.assertEqual(shared_storage['results'][0]['attempts'], 2)
         self.assertEqual(shared_storage['results'][0]['result'], "async_fallback")
 
-    def test_async_fallback_in_flow(self):
+    async def test_async_fallback_in_flow(self):
         """Test that async fallback works within an AsyncFlow"""
         class AsyncResultNode(AsyncNode):
             async def prep_async(self, shared_storage):
@@ -183,27 +166,23 @@ class TestAsyncExecFallback(unittest.TestCase):
                 shared_storage['final_result'] = exec_result
                 return "done"
         
-        async def run_test():
-            shared_storage = {}
-            fallback_node = AsyncFallbackNode(should_fail=True)
-            result_node = AsyncResultNode()
-            fallback_node >> result_node
-            
-            flow = AsyncFlow(start=fallback_node)
-            await flow.run_async(shared_storage)
-            return shared_storage
+        shared_storage = {}
+        fallback_node = AsyncFallbackNode(should_fail=True)
+        result_node = AsyncResultNode()
+        fallback_node >> result_node
+        
+        flow = AsyncFlow(start=fallback_node)
+        await flow.run_async(shared_storage)
         
-        shared_storage = self.loop.run_until_complete(run_test())
         self.assertEqual(len(shared_storage['results']), 1)
         self.assertEqual(shared_storage['results'][0]['result'], "async_fallback")
         self.assertEqual(shared_storage['final_result'], "async_fallback")
 
-    def test_async_no_fallback_implementation(self):
+    async def test_async_no_fallback_implementation(self):
         """Test that default async fallback behavior raises the exception"""
         class NoFallbackAsyncNode(AsyncNode):
             async def prep_async(self, shared_storage):
-                if 'results' not in shared_storage:
-                    shared_storage['results'] = []
+                shared_storage.setdefault('results', [])
                 return None
             
             async def exec_async(self, prep_result):
@@ -213,23 +192,17 @@ class TestAsyncExecFallback(unittest.TestCase):
                 shared_storage['results'].append({'result': exec_result})
                 return exec_result
         
-        async def run_test():
-            shared_storage = {}
-            node = NoFallbackAsyncNode()
-            await node.run_async(shared_storage)
-        
+        shared_storage = {}
+        node = NoFallbackAsyncNode()
         with self.assertRaises(ValueError):
-            self.loop.run_until_complete(run_test())
+            await node.run_async(shared_storage)
 
-    def test_async_retry_before_fallback(self):
+    async def test_async_retry_before_fallback(self):
         """Test that retries are attempted before calling async fallback"""
-        async def run_test():
-            shared_storage = {}
-            node = AsyncFallbackNode(should_fail=True, max_retries=3)
-            result = await node.run_async(shared_storage)
-            return result, shared_storage
+        shared_storage = {}
+        node = AsyncFallbackNode(should_fail=True, max_retries=3)
+        await node.run_async(shared_storage)
         
-        result, shared_storage = self.loop.run_until_complete(run_test())
         self.assertEqual(len(shared_storage['results']), 1)
         self.assertEqual(shared_storage['results'][0]['attempts'], 3)
         self.assertEqual(shared_storage['results'][0]['result'], "async_fallback")